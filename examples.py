@@ -16,11 +16,64 @@ Demonstrates real-world usage patterns for construction data extraction
 """
 
 import asyncio
+import contextlib
+import hashlib
 import json
-from server import ConstructionScraper, ScraperConfig
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from server import ConstructionScraper, ScraperConfig, dumps_json, with_backoff
 
+try:
+    import uvloop
+except ImportError:  # optional libuv event loop; asyncio's default otherwise
+    uvloop = None
 
-async def example_1_construction_projects():
+# Upper bound on simultaneous scrapes in the multi-site examples.
+# Per-host spacing is enforced by the scraper's DomainRateLimiter.
+MAX_CONCURRENCY = 5
+
+# Batch job checkpoint: successful scrapes are reused for a day
+CHECKPOINT_FILE = Path("/tmp/batch_checkpoint.json")
+CHECKPOINT_TTL = 24 * 60 * 60
+
+# Attempts per error-handling case, including the first
+MAX_RETRIES = 3
+
+
+def retry_deadline(timeout_ms: int, max_retries: int = MAX_RETRIES) -> float:
+    """
+    Seconds that with_backoff may need in the worst case: every attempt
+    times out, every wait between attempts is stretched by Retry-After to
+    with_backoff's default cap, plus one second of slack.
+    """
+    backoff = 32.0 * (max_retries - 1)
+    return max_retries * timeout_ms / 1000 + backoff + 1
+
+
+def checkpoint_key(url: str, selectors: dict[str, str]) -> str:
+    """Key a checkpoint entry by URL and selectors, so edited patterns re-scrape"""
+    digest = hashlib.sha256(json.dumps(selectors, sort_keys=True).encode()).hexdigest()
+    return f"{url}#{digest[:16]}"
+
+
+def load_checkpoint() -> dict:
+    """Read the batch checkpoint, starting fresh if it is missing or corrupt"""
+    try:
+        return json.loads(CHECKPOINT_FILE.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_checkpoint(checkpoint: dict):
+    """Atomically replace the checkpoint so an interrupted run never truncates it"""
+    tmp_file = CHECKPOINT_FILE.with_suffix(".tmp")
+    tmp_file.write_text(dumps_json(checkpoint), encoding="utf-8")
+    os.replace(tmp_file, CHECKPOINT_FILE)
+
+
+async def example_1_construction_projects(scraper: ConstructionScraper):
     """
     Example 1: Scraping construction project listings
     Common use case: Building project database from public listings
@@ -29,8 +82,6 @@ async def example_1_construction_projects():
     print("EXAMPLE 1: Construction Project Listings")
     print("="*60)
     
-    scraper = ConstructionScraper()
-    
     # Example configuration for a typical construction project site
     config = ScraperConfig(
         url="https://example-construction-projects.com",
@@ -59,17 +110,16 @@ async def example_1_construction_projects():
     if result.success:
         print("✅ Scraping successful!")
         print("\nExtracted Data:")
-        print(json.dumps(result.data, indent=2))
+        print(dumps_json(result.data))
     else:
         print("⚠️ Scraping completed with errors:")
         for error in result.errors:
             print(f"  ❌ {error}")
     
-    await scraper.cleanup()
     return result
 
 
-async def example_2_material_pricing():
+async def example_2_material_pricing(scraper: ConstructionScraper):
     """
     Example 2: Tracking building material prices
     Use case: Monitor price changes across multiple suppliers
@@ -78,8 +128,6 @@ async def example_2_material_pricing():
     print("EXAMPLE 2: Material Pricing Tracker")
     print("="*60)
     
-    scraper = ConstructionScraper()
-    
     # Multiple supplier sites to check
     suppliers = [
         {
@@ -104,9 +152,9 @@ async def example_2_material_pricing():
         }
     ]
     
-    results = []
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
     
-    for supplier in suppliers:
+    async def check_supplier(supplier):
         print(f"\n📊 Checking {supplier['name']}...")
         
         config = ScraperConfig(
@@ -115,24 +163,24 @@ async def example_2_material_pricing():
             screenshot=False
         )
         
-        result = await scraper.scrape_pattern(config)
-        results.append({
+        async with semaphore:
+            result = await scraper.scrape_pattern(config)
+        return {
             "supplier": supplier["name"],
             "data": result.data,
             "success": result.success
-        })
-        
-        # Be respectful with rate limiting
-        await asyncio.sleep(2)
+        }
+    
+    # Suppliers live on different hosts, so they are checked concurrently
+    results = await asyncio.gather(*(check_supplier(s) for s in suppliers))
     
     print("\n📋 Price Comparison Results:")
-    print(json.dumps(results, indent=2))
+    print(dumps_json(results))
     
-    await scraper.cleanup()
     return results
 
 
-async def example_3_selector_adaptation():
+async def example_3_selector_adaptation(scraper: ConstructionScraper):
     """
     Example 3: Adapting patterns when selectors change
     Use case: Site updates HTML structure, need to update selectors
@@ -141,8 +189,6 @@ async def example_3_selector_adaptation():
     print("EXAMPLE 3: Pattern Adaptation (Site Structure Change)")
     print("="*60)
     
-    scraper = ConstructionScraper()
-    
     # Scenario: Site changed from .old-class to .new-class
     print("\n📝 Original Pattern (no longer works):")
     old_config = ScraperConfig(
@@ -153,7 +199,7 @@ async def example_3_selector_adaptation():
             "issue_date": ".date-issued"     # Old selector
         }
     )
-    print(json.dumps(old_config.selectors, indent=2))
+    print(dumps_json(old_config.selectors))
     
     print("\n🔄 Adapted Pattern (updated selectors):")
     new_config = ScraperConfig(
@@ -163,9 +209,10 @@ async def example_3_selector_adaptation():
             "permit_number": ".permit-number, .permit-id, [data-permit]",
             "project_address": ".project-address, .address, .location",
             "issue_date": ".issued-date, .date-issued, .permit-date"
-        }
+        },
+        screenshot=False
     )
-    print(json.dumps(new_config.selectors, indent=2))
+    print(dumps_json(new_config.selectors))
     
     print("\n⏳ Testing adapted pattern...")
     result = await scraper.scrape_pattern(new_config)
@@ -178,11 +225,10 @@ async def example_3_selector_adaptation():
         for error in result.errors:
             print(f"  ❌ {error}")
     
-    await scraper.cleanup()
     return result
 
 
-async def example_4_error_handling():
+async def example_4_error_handling(scraper: ConstructionScraper):
     """
     Example 4: Robust error handling for production
     Use case: Handle common failure scenarios gracefully
@@ -191,8 +237,6 @@ async def example_4_error_handling():
     print("EXAMPLE 4: Production Error Handling")
     print("="*60)
     
-    scraper = ConstructionScraper()
-    
     # Test multiple scenarios
     test_cases = [
         {
@@ -222,11 +266,17 @@ async def example_4_error_handling():
         config = ScraperConfig(
             url=test.get("url", "https://example.com"),
             selectors=test.get("selectors", {"title": "h1"}),
-            timeout=test.get("timeout", 30000)
+            timeout=test.get("timeout", 30000),
+            screenshot=False
         )
         
         try:
-            result = await scraper.scrape_pattern(config)
+            # Timeouts, network errors and 429/5xx are retried; content errors are not.
+            # The outer deadline leaves room for every retry, but no more.
+            result = await asyncio.wait_for(
+                with_backoff(scraper.scrape_pattern, config, max_retries=MAX_RETRIES),
+                timeout=retry_deadline(config.timeout)
+            )
             
             print(f"   Status: {'✅ Success' if result.success else '⚠️ Failed'}")
             print(f"   Errors: {len(result.errors)}")
@@ -237,15 +287,13 @@ async def example_4_error_handling():
                 for error in result.errors[:3]:  # Show first 3 errors
                     print(f"     - {error}")
                     
+        except asyncio.TimeoutError:
+            print("   ⏱ Timed out (outer)")
         except Exception as e:
             print(f"   💥 Exception: {str(e)}")
-        
-        await asyncio.sleep(1)
-    
-    await scraper.cleanup()
 
 
-async def example_5_batch_processing():
+async def example_5_batch_processing(scraper: ConstructionScraper):
     """
     Example 5: Batch processing multiple URLs
     Use case: Daily scraping job for market intelligence
@@ -254,8 +302,6 @@ async def example_5_batch_processing():
     print("EXAMPLE 5: Batch Processing (Daily Market Intelligence)")
     print("="*60)
     
-    scraper = ConstructionScraper()
-    
     # Simulate daily scraping job
     target_sites = [
         "https://permits.city-a.gov/recent",
@@ -263,47 +309,74 @@ async def example_5_batch_processing():
         "https://permits.city-c.gov/applications"
     ]
     
-    all_results = []
+    selectors = {
+        "permit_type": ".type, .permit-type",
+        "applicant": ".applicant, .company",
+        "value": ".value, .estimated-cost",
+        "status": ".status"
+    }
+    
+    # Resume support: reuse sites that already succeeded within the TTL
+    checkpoint = load_checkpoint()
+    now = time.time()
+    records = {}
+    pending = []
     
     print(f"\n📅 Processing {len(target_sites)} sites...")
     
     for idx, url in enumerate(target_sites, 1):
-        print(f"\n[{idx}/{len(target_sites)}] {url}")
+        entry = checkpoint.get(checkpoint_key(url, selectors))
+        if entry and entry["success"] and entry["ts"] > now - CHECKPOINT_TTL:
+            print(f"\n[{idx}/{len(target_sites)}] {url} (from checkpoint)")
+            records[url] = entry["result"]
+        else:
+            print(f"\n[{idx}/{len(target_sites)}] {url}")
+            pending.append(url)
+    
+    # Resolve hosts and fetch robots.txt for every pending site up front
+    await asyncio.gather(*(scraper.prewarm(url) for url in pending))
+    
+    # One shared config, all remaining sites scraped concurrently. Each
+    # result is checkpointed and appended to the output as soon as it lands.
+    base_config = ScraperConfig(url="", selectors=selectors, screenshot=False)
+    output_file = f"/tmp/batch_results_{datetime.now().isoformat()}.json"
+    
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write("[\n" + ",\n".join(dumps_json(record) for record in records.values()))
+        first = not records
         
-        config = ScraperConfig(
-            url=url,
-            selectors={
-                "permit_type": ".type, .permit-type",
-                "applicant": ".applicant, .company",
-                "value": ".value, .estimated-cost",
-                "status": ".status"
-            }
-        )
+        # aclosing runs the batch's cleanup even if a write below raises
+        async with contextlib.aclosing(scraper.iter_pattern_batch(
+            pending, base_config, max_concurrency=MAX_CONCURRENCY
+        )) as results:
+            async for url, result in results:
+                records[url] = {
+                    "url": url,
+                    "timestamp": result.timestamp,
+                    "success": result.success,
+                    "data": result.data
+                }
+                if result.success:
+                    checkpoint[checkpoint_key(url, selectors)] = {
+                        "ts": time.time(), "success": True, "result": records[url]
+                    }
+                    save_checkpoint(checkpoint)
+                
+                f.write(("" if first else ",\n") + dumps_json(records[url]))
+                f.flush()
+                first = False
         
-        result = await scraper.scrape_pattern(config)
-        all_results.append({
-            "url": url,
-            "timestamp": result.timestamp,
-            "success": result.success,
-            "data": result.data
-        })
-        
-        # Rate limiting between requests
-        await asyncio.sleep(3)
+        f.write("\n]\n")
+    
+    all_results = [records[url] for url in target_sites]
     
     print("\n📊 Batch Processing Summary:")
     successful = sum(1 for r in all_results if r["success"])
     print(f"  Total sites processed: {len(all_results)}")
     print(f"  Successful: {successful}")
     print(f"  Failed: {len(all_results) - successful}")
-    
-    # Save batch results
-    output_file = f"/tmp/batch_results_{all_results[0]['timestamp']}.json"
-    with open(output_file, 'w') as f:
-        json.dump(all_results, f, indent=2)
     print(f"\n💾 Results saved to: {output_file}")
     
-    await scraper.cleanup()
     return all_results
 
 
@@ -322,14 +395,19 @@ async def main():
         ("Batch Processing", example_5_batch_processing),
     ]
     
-    for name, example_func in examples:
-        try:
-            await example_func()
-        except Exception as e:
-            print(f"\n❌ Example '{name}' failed: {str(e)}")
-        
-        print("\n" + "-"*60)
-        await asyncio.sleep(1)
+    # One browser shared by every example, launched once and closed once
+    scraper = ConstructionScraper()
+    try:
+        for name, example_func in examples:
+            try:
+                await example_func(scraper)
+            except Exception as e:
+                print(f"\n❌ Example '{name}' failed: {str(e)}")
+            
+            print("\n" + "-"*60)
+            await asyncio.sleep(1)
+    finally:
+        await scraper.cleanup()
     
     print("\n✅ All examples completed!")
     print("\nNext Steps:")
@@ -345,7 +423,8 @@ if __name__ == "__main__":
     print("🏗️ " * 20)
     
     try:
-        asyncio.run(main())
+        run = uvloop.run if uvloop is not None else asyncio.run
+        run(main())
     except KeyboardInterrupt:
         print("\n\n⏸️  Examples interrupted by user")
     except Exception as e:
@@ -16,62 +16,201 @@ Simple interface for running scraping patterns
 """
 
 import sys
-import json
+import csv
 import asyncio
+import importlib
+import threading
+from concurrent.futures import Future
 from pathlib import Path
+from typing import TYPE_CHECKING, Mapping
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QTextEdit, QComboBox,
-    QCheckBox, QGroupBox, QFileDialog, QMessageBox, QTabWidget
+    QCheckBox, QGroupBox, QFileDialog, QMessageBox, QTabWidget, QSplashScreen,
+    QTableView, QHeaderView, QAbstractItemView
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QFont, QTextCursor
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QPixmap, QTextCursor
 
-# Import our scraper
+try:
+    import uvloop
+except ImportError:  # optional libuv event loop; asyncio's default otherwise
+    uvloop = None
+
+# Our scraper (MCP + Playwright) is imported after the window is shown
 import sys
 sys.path.append(str(Path(__file__).parent))
-from server import ConstructionScraper, ScraperConfig, ScraperResult
+from patterns import PATTERNS
+if TYPE_CHECKING:
+    from server import ScraperResult
 
 
-class ScraperThread(QThread):
-    """Background thread for scraping operations"""
-    finished = pyqtSignal(object)
-    error = pyqtSignal(str)
+class SelectorModel(QAbstractTableModel):
+    """Editable (field, selector) rows behind the selector table"""
     
-    def __init__(self, config: ScraperConfig):
-        super().__init__()
-        self.config = config
-        
-    def run(self):
-        """Execute scraping in background"""
-        try:
-            # Create new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            scraper = ConstructionScraper()
-            result = loop.run_until_complete(scraper.scrape_pattern(self.config))
-            loop.run_until_complete(scraper.cleanup())
-            
-            self.finished.emit(result)
-        except Exception as e:
-            self.error.emit(str(e))
+    HEADERS = ("Field", "Selector")
+    
+    def __init__(self, fields: list[str], parent=None):
+        super().__init__(parent)
+        self.rows = [[field, ""] for field in fields]
+        # Non-empty selectors by field, refreshed on every edit
+        self.active: dict[str, str] = {}
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        field, selector = self.rows[index.row()]
+        value = self.rows[index.row()][index.column()]
+        # Empty selectors show a grey hint, like a QLineEdit placeholder
+        placeholder = index.column() == 1 and not selector
+        if role == Qt.ItemDataRole.EditRole:
+            return value
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f".{field}, #{field}" if placeholder else value
+        if role == Qt.ItemDataRole.ForegroundRole and placeholder:
+            return QColor("gray")
+        return None
+    
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemFlag.ItemIsEditable
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or not index.isValid():
+            return False
+        value = str(value).strip()
+        if index.column() == 0 and not value:
+            return False  # every row needs a field name
+        self.rows[index.row()][index.column()] = value
+        self._refresh_active()
+        self.dataChanged.emit(index, index, [role])
+        return True
+    
+    def insertRows(self, row, count, parent=QModelIndex()):
+        self.beginInsertRows(parent, row, row + count - 1)
+        for offset in range(count):
+            self.rows.insert(row + offset, [f"custom_{len(self.rows) + 1}", ""])
+        self.endInsertRows()
+        return True
+    
+    def removeRows(self, row, count, parent=QModelIndex()):
+        if count <= 0 or row < 0 or row + count > len(self.rows):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self.rows[row:row + count]
+        self.endRemoveRows()
+        self._refresh_active()
+        return True
+    
+    def load_pattern(self, selectors: Mapping[str, str]):
+        """
+        Replace every selector with a pattern's. Fields the pattern lacks
+        are cleared; fields the table lacks get new rows.
+        """
+        known = {row[0] for row in self.rows}
+        for row in self.rows:
+            row[1] = selectors.get(row[0], "").strip()
+        missing = [field for field in selectors if field not in known]
+        if missing:
+            start = len(self.rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(missing) - 1)
+            self.rows.extend([field, selectors[field].strip()] for field in missing)
+            self.endInsertRows()
+        self._refresh_active()
+        if self.rows:
+            self.dataChanged.emit(self.index(0, 1), self.index(len(self.rows) - 1, 1))
+    
+    def _refresh_active(self):
+        self.active = {field: selector for field, selector in self.rows if selector}
 
 
 class ConstructionScraperGUI(QMainWindow):
     """Main application window"""
     
+    # Emitted from the asyncio thread; Qt delivers them on the GUI thread
+    scrape_done = pyqtSignal(object)
+    scrape_failed = pyqtSignal(str)
+    # Emitted once the scraper engine has been imported
+    engine_ready = pyqtSignal()
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Construction Data Scraper")
         self.setMinimumSize(1000, 700)
         
         # State
-        self.current_thread = None
-        self.selector_inputs = {}
+        self.current_future = None
+        # Set once the window starts closing; late scrape callbacks are dropped
+        self._closing = False
+        self.selector_model = SelectorModel(
+            ["project_name", "location", "price", "status", "contractor"]
+        )
+        self.selector_model.dataChanged.connect(self._update_scrape_button)
+        self.selector_model.rowsRemoved.connect(self._update_scrape_button)
+        
+        # One long-lived asyncio loop on a daemon thread hosts the shared
+        # browser, so clicks after the first skip loop and browser startup
+        self._loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._run_loop, name="scraper-loop", daemon=True
+        )
+        self._loop_thread.start()
+        self._engine = None
+        self._scraper = None
+        
+        self.scrape_done.connect(self._scraping_finished)
+        self.scrape_failed.connect(self._scraping_error)
         
         self._init_ui()
         
+        # Paint the window first, then load the scraper engine
+        self._update_scrape_button()
+        QTimer.singleShot(0, self._late_init)
+        
+    def _late_init(self):
+        """Import the scraper engine once the window is on screen"""
+        try:
+            self._engine = importlib.import_module("server")
+        except ImportError as e:
+            QMessageBox.critical(self, "Startup Error", f"Failed to load scraper:\n{e}")
+            return
+        finally:
+            self.engine_ready.emit()
+        self._scraper = self._engine.ConstructionScraper()
+        self._update_scrape_button()
+        
+    def _run_loop(self):
+        """Background thread body: serve scrape coroutines until shutdown"""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+        
+    def closeEvent(self, event):
+        """Shut down the shared browser when the window closes"""
+        # Future.cancel() runs the done callback right here on the GUI
+        # thread; the flag keeps it from popping an error dialog mid-close
+        self._closing = True
+        if self.current_future is not None:
+            self.current_future.cancel()
+        if self._scraper is not None:
+            cleanup = asyncio.run_coroutine_threadsafe(self._scraper.cleanup(), self._loop)
+            try:
+                cleanup.result(timeout=10)
+            except Exception:
+                pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=5)
+        super().closeEvent(event)
+        
     def _init_ui(self):
         """Initialize user interface"""
         central = QWidget()
@@ -115,6 +254,7 @@ class ConstructionScraperGUI(QMainWindow):
         url_row.addWidget(QLabel("URL:"))
         self.url_input = QLineEdit()
         self.url_input.setPlaceholderText("https://example.com/construction-data")
+        self.url_input.editingFinished.connect(self._prewarm_url)
         url_row.addWidget(self.url_input)
         url_layout.addLayout(url_row)
         
@@ -132,20 +272,26 @@ class ConstructionScraperGUI(QMainWindow):
         selector_group = QGroupBox("Data Selectors")
         selector_layout = QVBoxLayout()
         
-        # Add common selectors
-        for field in ["project_name", "location", "price", "status", "contractor"]:
-            row = QHBoxLayout()
-            row.addWidget(QLabel(f"{field}:"))
-            input_field = QLineEdit()
-            input_field.setPlaceholderText(f".{field}, #{field}")
-            self.selector_inputs[field] = input_field
-            row.addWidget(input_field)
-            selector_layout.addLayout(row)
+        # Common selectors; rows live in the model, the view only paints them
+        self.selector_table = QTableView()
+        self.selector_table.setModel(self.selector_model)
+        self.selector_table.verticalHeader().hide()
+        self.selector_table.horizontalHeader().setSectionResizeMode(
+            1, QHeaderView.ResizeMode.Stretch
+        )
+        self.selector_table.setEditTriggers(QAbstractItemView.EditTrigger.AllEditTriggers)
+        selector_layout.addWidget(self.selector_table)
         
         # Add custom selector button
+        selector_buttons = QHBoxLayout()
         add_btn = QPushButton("+ Add Custom Selector")
         add_btn.clicked.connect(self._add_custom_selector)
-        selector_layout.addWidget(add_btn)
+        selector_buttons.addWidget(add_btn)
+        
+        remove_btn = QPushButton("− Remove Selected")
+        remove_btn.clicked.connect(self._remove_selected_selectors)
+        selector_buttons.addWidget(remove_btn)
+        selector_layout.addLayout(selector_buttons)
         
         selector_group.setLayout(selector_layout)
         layout.addWidget(selector_group)
@@ -204,28 +350,7 @@ class ConstructionScraperGUI(QMainWindow):
         
         layout.addWidget(QLabel("Pre-built Scraping Patterns"))
         
-        patterns = {
-            "Construction Projects": {
-                "project_name": ".project-title, h1.title",
-                "location": ".location, .address",
-                "budget": ".budget, .cost",
-                "status": ".status"
-            },
-            "Material Pricing": {
-                "material_name": ".product-name",
-                "price": ".price",
-                "supplier": ".supplier",
-                "availability": ".stock"
-            },
-            "Contractor Directory": {
-                "company_name": ".company-name, h1",
-                "contact_email": "a[href^='mailto:']",
-                "phone": ".phone",
-                "specialties": ".specialty"
-            }
-        }
-        
-        for name, selectors in patterns.items():
+        for name, selectors in PATTERNS.items():
             btn = QPushButton(f"Load: {name}")
             btn.clicked.connect(lambda checked, s=selectors: self._load_pattern(s))
             layout.addWidget(btn)
@@ -248,14 +373,23 @@ class ConstructionScraperGUI(QMainWindow):
     
     def _add_custom_selector(self):
         """Add a custom selector field"""
-        # This would dynamically add a new row
-        pass
+        row = self.selector_model.rowCount()
+        self.selector_model.insertRow(row)
+        self.selector_table.edit(self.selector_model.index(row, 0))
+    
+    def _remove_selected_selectors(self):
+        """Remove the selector rows that are selected in the table"""
+        rows = {index.row() for index in self.selector_table.selectionModel().selectedIndexes()}
+        current = self.selector_table.currentIndex()
+        if not rows and current.isValid():
+            rows = {current.row()}
+        # Bottom-up, so earlier removals don't shift the rows still to go
+        for row in sorted(rows, reverse=True):
+            self.selector_model.removeRow(row)
     
-    def _load_pattern(self, selectors: dict):
+    def _load_pattern(self, selectors: Mapping[str, str]):
         """Load a predefined pattern"""
-        for field, selector in selectors.items():
-            if field in self.selector_inputs:
-                self.selector_inputs[field].setText(selector)
+        self.selector_model.load_pattern(selectors)
         
         QMessageBox.information(self, "Pattern Loaded", "Pattern selectors loaded successfully!")
     
@@ -266,9 +400,24 @@ class ConstructionScraperGUI(QMainWindow):
             QMessageBox.warning(self, "Error", "Please enter a URL")
             return
         
-        self.results_text.append("\n--- Validating Selectors ---")
-        self.results_text.append("This feature would test each selector...")
-        self.results_text.append("✓ Implementation in production version\n")
+        self.results_text.append("\n".join([
+            "\n--- Validating Selectors ---",
+            "This feature would test each selector...",
+            "✓ Implementation in production version\n",
+        ]))
+    
+    def _prewarm_url(self):
+        """Resolve the target host and fetch robots.txt while the user edits selectors"""
+        url = self.url_input.text().strip()
+        if url and self._scraper is not None:
+            asyncio.run_coroutine_threadsafe(self._scraper.prewarm(url), self._loop)
+    
+    def _update_scrape_button(self):
+        """Enable scraping once the engine is loaded, idle, and has selectors"""
+        busy = self.current_future is not None and not self.current_future.done()
+        self.scrape_btn.setEnabled(
+            self._scraper is not None and not busy and bool(self.selector_model.active)
+        )
     
     def _start_scraping(self):
         """Start scraping operation"""
@@ -278,19 +427,13 @@ class ConstructionScraperGUI(QMainWindow):
             QMessageBox.warning(self, "Error", "Please enter a URL")
             return
         
-        # Build selectors dict
-        selectors = {}
-        for field, input_widget in self.selector_inputs.items():
-            selector = input_widget.text().strip()
-            if selector:
-                selectors[field] = selector
-        
+        selectors = dict(self.selector_model.active)
         if not selectors:
             QMessageBox.warning(self, "Error", "Please enter at least one selector")
             return
         
         # Create config
-        config = ScraperConfig(
+        config = self._engine.ScraperConfig(
             url=url,
             selectors=selectors,
             wait_for=self.wait_input.text().strip() or None,
@@ -302,46 +445,61 @@ class ConstructionScraperGUI(QMainWindow):
         self.validate_btn.setEnabled(False)
         
         # Clear results
-        self.results_text.clear()
-        self.results_text.append("🔄 Scraping in progress...\n")
-        
-        # Start background thread
-        self.current_thread = ScraperThread(config)
-        self.current_thread.finished.connect(self._scraping_finished)
-        self.current_thread.error.connect(self._scraping_error)
-        self.current_thread.start()
+        self.results_text.setPlainText("🔄 Scraping in progress...\n")
+        
+        # Hand the scrape to the background loop
+        self.current_future = asyncio.run_coroutine_threadsafe(
+            self._scraper.scrape_pattern(config), self._loop
+        )
+        self.current_future.add_done_callback(self._on_scrape_done)
+    
+    def _on_scrape_done(self, future: "Future[ScraperResult]"):
+        """
+        Forward a finished scrape to the GUI thread. Runs on the loop thread,
+        or on the GUI thread when the future is cancelled.
+        """
+        if self._closing:
+            return
+        # CancelledError is a BaseException, so check before result()
+        if future.cancelled():
+            self.scrape_failed.emit("Scrape cancelled")
+            return
+        try:
+            self.scrape_done.emit(future.result())
+        except Exception as e:
+            self.scrape_failed.emit(str(e))
     
-    def _scraping_finished(self, result: ScraperResult):
+    def _scraping_finished(self, result: "ScraperResult"):
         """Handle scraping completion"""
-        self.scrape_btn.setEnabled(True)
+        self._update_scrape_button()
         self.validate_btn.setEnabled(True)
         
-        # Display results
-        self.results_text.clear()
-        
+        # Display results, built up front so the view lays out once
+        lines = []
         if result.success:
-            self.results_text.append("✅ Scraping Successful!\n")
+            lines.append("✅ Scraping Successful!\n")
         else:
-            self.results_text.append("⚠️ Scraping completed with errors\n")
+            lines.append("⚠️ Scraping completed with errors\n")
         
-        self.results_text.append(f"Timestamp: {result.timestamp}")
-        self.results_text.append(f"\n--- Extracted Data ---")
-        self.results_text.append(json.dumps(result.data, indent=2))
+        lines.append(f"Timestamp: {result.timestamp}")
+        lines.append("\n--- Extracted Data ---")
+        lines.append(self._engine.dumps_json(result.data))
         
         if result.errors:
-            self.results_text.append(f"\n--- Errors ---")
-            for error in result.errors:
-                self.results_text.append(f"❌ {error}")
+            lines.append("\n--- Errors ---")
+            lines.extend(f"❌ {error}" for error in result.errors)
         
         if result.screenshot_path:
-            self.results_text.append(f"\n📸 Screenshot: {result.screenshot_path}")
+            lines.append(f"\n📸 Screenshot: {result.screenshot_path}")
+        
+        self.results_text.setPlainText("\n".join(lines))
         
         # Store for export
         self.last_result = result
     
     def _scraping_error(self, error: str):
         """Handle scraping error"""
-        self.scrape_btn.setEnabled(True)
+        self._update_scrape_button()
         self.validate_btn.setEnabled(True)
         
         QMessageBox.critical(self, "Scraping Error", f"Failed to scrape data:\n{error}")
@@ -364,16 +522,19 @@ class ConstructionScraperGUI(QMainWindow):
         if filename:
             try:
                 if format_type == "json":
-                    with open(filename, 'w') as f:
-                        json.dump(self.last_result.data, f, indent=2)
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        f.write(self._engine.dumps_json(self.last_result.data))
                 else:
-                    # Simple CSV export
-                    import csv
-                    with open(filename, 'w', newline='') as f:
-                        if self.last_result.data:
-                            writer = csv.DictWriter(f, fieldnames=self.last_result.data.keys())
+                    # One dict per row; a single scrape is a one-row batch
+                    data = self.last_result.data
+                    rows = data if isinstance(data, list) else [data] if data else []
+                    with open(filename, 'w', newline='', encoding='utf-8',
+                              buffering=1 << 20) as f:
+                        if rows:
+                            fieldnames = list(dict.fromkeys(k for row in rows for k in row))
+                            writer = csv.DictWriter(f, fieldnames=fieldnames)
                             writer.writeheader()
-                            writer.writerow(self.last_result.data)
+                            writer.writerows(rows)
                 
                 QMessageBox.information(self, "Success", f"Results exported to:\n{filename}")
             except Exception as e:
@@ -383,7 +544,17 @@ class ConstructionScraperGUI(QMainWindow):
 def main():
     """Run the GUI application"""
     app = QApplication(sys.argv)
+    
+    # Minimal splash while the scraper engine loads behind the window
+    pixmap = QPixmap(420, 120)
+    pixmap.fill(QColor("#4CAF50"))
+    splash = QSplashScreen(pixmap)
+    splash.showMessage("Loading scraper engine...", Qt.AlignmentFlag.AlignCenter, QColor("white"))
+    splash.show()
+    app.processEvents()
+    
     window = ConstructionScraperGUI()
+    window.engine_ready.connect(lambda: splash.finish(window))
     window.show()
     sys.exit(app.exec())
 
@@ -0,0 +1,42 @@
+#----------------------------------------------------------------------------
+#File: patterns.py
+#Project: provizual-demo
+#Created by: Celaya Solutions, 2025
+#Author: Christopher Celaya <chris@chriscelaya.com>
+#Description: Pre-built selector patterns for the pattern library
+#Version: 1.0.0
+#License: MIT
+#Last Update: January 2026
+#----------------------------------------------------------------------------
+
+"""
+Pre-built Scraping Patterns
+Read-only selector templates, built once at import and shared
+"""
+
+from types import MappingProxyType
+from typing import Mapping
+
+PATTERNS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    name: MappingProxyType(selectors)
+    for name, selectors in {
+        "Construction Projects": {
+            "project_name": ".project-title, h1.title",
+            "location": ".location, .address",
+            "budget": ".budget, .cost",
+            "status": ".status"
+        },
+        "Material Pricing": {
+            "material_name": ".product-name",
+            "price": ".price",
+            "supplier": ".supplier",
+            "availability": ".stock"
+        },
+        "Contractor Directory": {
+            "company_name": ".company-name, h1",
+            "contact_email": "a[href^='mailto:']",
+            "phone": ".phone",
+            "specialties": ".specialty"
+        }
+    }.items()
+})
@@ -17,10 +17,27 @@ Built for Provizual-style workflows with Playwright + LLM integration
 """
 
 import asyncio
+import copy
+import functools
+import importlib.util
+import itertools
 import json
 import logging
-from typing import Any, Optional
-from datetime import datetime
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Iterator, Literal, Optional
+)
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
 
 from mcp.server import Server
 from mcp.types import (
@@ -31,7 +48,25 @@ from mcp.types import (
     EmbeddedResource,
 )
 from pydantic import BaseModel, Field
-from playwright.async_api import async_playwright, Browser, Page
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page
+
+try:
+    import orjson
+except ImportError:  # optional C encoder; stdlib json is the fallback
+    orjson = None
+
+try:
+    from lxml import html as lxml_html
+    from lxml.cssselect import CSSSelector, SelectorError
+except ImportError:  # without lxml, every page goes through the browser
+    lxml_html = None
+
+try:
+    import httpx
+except ImportError:  # without httpx, every page goes through the browser
+    httpx = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -40,6 +75,178 @@ logger = logging.getLogger("construction-scraper")
 # Initialize MCP Server
 app = Server("construction-scraper")
 
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# Headless scraping needs no GPU, background services or /dev/shm (often tiny
+# in containers); fewer helper processes means more pages per host
+BROWSER_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-renderer-backgrounding",
+)
+
+# Resource types a text scrape never needs
+DEFAULT_BLOCKED_RESOURCES = frozenset({"image", "font", "media"})
+
+# Failures worth retrying: rate limiting, server-side errors and flaky networks.
+# Other 4xx responses and missing selectors are content errors and are final.
+RETRYABLE_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+TRANSIENT_NETWORK_ERRORS = (
+    "net::ERR_CONNECTION_",
+    "net::ERR_TIMED_OUT",
+    "net::ERR_NETWORK_CHANGED",
+    "net::ERR_EMPTY_RESPONSE",
+    "net::ERR_HTTP2_PROTOCOL_ERROR",
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _selector_atoms(selector: str) -> tuple[str, ...]:
+    """
+    Split a comma-separated selector list into unique, stripped atoms.
+    Commas nested in brackets, parentheses or quotes are not split on,
+    so selectors like "a[title='x, y']" and ":is(.a, .b)" stay intact.
+    """
+    atoms = []
+    depth = 0
+    quote = None
+    start = 0
+    for i, char in enumerate(selector):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            atoms.append(selector[start:i])
+            start = i + 1
+    atoms.append(selector[start:])
+    return tuple(dict.fromkeys(a.strip() for a in atoms if a.strip()))
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_selector(selector: str) -> str:
+    """
+    Canonical form of a selector list, parsed once per distinct string.
+    Atoms are sorted: a selector list matches in document order whatever
+    order it is written in, so ".price, .cost" and ".cost, .price" share
+    one query.
+    """
+    return ", ".join(sorted(_selector_atoms(selector)))
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_selector(selector: str) -> Optional["CSSSelector"]:
+    """
+    Compile a selector to an lxml matcher once per distinct string.
+    Returns None for selectors cssselect cannot translate (for example
+    Playwright-only pseudo classes), which only work in the browser.
+    """
+    try:
+        return CSSSelector(selector, translator="html")
+    except SelectorError:
+        return None
+
+
+def _extracted_value(texts: list[Optional[str]]) -> Any:
+    """Shape matched element texts: one element is a string, several a list"""
+    if len(texts) == 1:
+        return texts[0].strip() if texts[0] else None
+    return [text.strip() for text in texts if text]
+
+
+# Installed in every page as an init script, so the query helper is parsed
+# once per document. Invalid selectors report their error instead of throwing.
+EXTRACT_INIT_JS = """
+window.__provizualQuery = (selector) => {
+    try {
+        return {texts: Array.from(document.querySelectorAll(selector), (el) => el.textContent)};
+    } catch (e) {
+        return {error: String(e && e.message || e)};
+    }
+};
+"""
+RESULT_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=128)
+def _build_extractor(selectors: tuple[str, ...]) -> str:
+    """
+    Generate an extractor with the selectors inlined as string literals.
+    A batch applies one pattern to many pages, so every page evaluates the
+    identical source, which V8 can compile once and reuse. Every selector
+    and the page title come back from one evaluate() call.
+    """
+    calls = ", ".join(f"q({json.dumps(selector)})" for selector in selectors)
+    return f"() => {{ const q = window.__provizualQuery; return {{title: document.title, matches: [{calls}]}}; }}"
+
+
+def _extract_fields(
+    selectors: dict[str, str],
+    query: Callable[[str], list[Optional[str]]],
+    errors: list[str]
+) -> dict[str, Any]:
+    """
+    Run field selectors through `query`, which maps a selector to the
+    texts of the elements it matches. Fields that share a selector are
+    served by a single query and keep the caller's field order. Errors
+    quote the selector as the first of those fields wrote it.
+    """
+    data = dict.fromkeys(selectors)
+    fields_by_selector: dict[str, list[str]] = {}
+    for key, selector in selectors.items():
+        fields_by_selector.setdefault(_normalize_selector(selector), []).append(key)
+    
+    for selector, keys in fields_by_selector.items():
+        value = None
+        try:
+            texts = query(selector)
+            if texts:
+                value = _extracted_value(texts)
+            else:
+                errors.append(f"Selector '{selectors[keys[0]]}' found no elements")
+        except Exception as e:
+            errors.extend(f"Failed to extract '{key}': {str(e)}" for key in keys)
+        for key in keys:
+            data[key] = list(value) if isinstance(value, list) else value
+    return data
+
+
+def _lxml_query(document: Any) -> Callable[[str], list[Optional[str]]]:
+    """Selector query against a parsed lxml document"""
+    def query(selector: str) -> list[Optional[str]]:
+        matcher = _compile_selector(selector)
+        if matcher is None:
+            raise ValueError("selector needs a browser page (set requires_js)")
+        return [elem.text_content() for elem in matcher(document)]
+    return query
+
+
+async def _page_query(
+    page: "Page",
+    selectors: dict[str, str]
+) -> tuple[Callable[[str], list[Optional[str]]], str]:
+    """
+    Match every selector in the page at once. Returns a query that reads
+    the results, plus the page title fetched in the same round-trip.
+    """
+    unique = list(dict.fromkeys(_normalize_selector(s) for s in selectors.values()))
+    snapshot = await page.evaluate(_build_extractor(tuple(unique)))
+    matches = dict(zip(unique, snapshot["matches"]))
+    
+    def query(selector: str) -> list[Optional[str]]:
+        match = matches[selector]
+        if "error" in match:
+            raise ValueError(match["error"])
+        return match["texts"]
+    return query, snapshot["title"]
+
 
 class ScraperConfig(BaseModel):
     """Configuration for a scraping pattern"""
@@ -56,20 +263,150 @@ class ScraperConfig(BaseModel):
         default=False,
         description="Capture screenshot for validation"
     )
+    screenshot_format: Literal["png", "jpeg"] = Field(
+        default="jpeg",
+        description="Screenshot encoding; JPEG encodes much faster than full-page PNG"
+    )
     timeout: int = Field(
         default=30000,
         description="Page load timeout in milliseconds"
     )
+    requires_js: bool = Field(
+        default=True,
+        description="Render in the browser; False fetches static HTML over HTTP"
+    )
+    cache_ttl: float = Field(
+        default=0,
+        description="Seconds to reuse a successful result for identical scrapes; 0 disables"
+    )
+    block_resources: set[str] = Field(
+        default_factory=lambda: set(DEFAULT_BLOCKED_RESOURCES),
+        description="Browser resource types to skip downloading; ignored for screenshots"
+    )
 
 
-class ScraperResult(BaseModel):
-    """Structured result from scraping operation"""
+@dataclass(slots=True)
+class ScraperResult:
+    """
+    Structured result from scraping operation.
+    Built only by the scraper itself, so a plain slotted dataclass: no
+    validation pass per result and a smaller footprint in large batches.
+    """
     success: bool
     data: dict[str, Any]
+    # Written in the background, so the file may appear just after the result
     screenshot_path: Optional[str] = None
-    errors: list[str] = Field(default_factory=list)
-    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    errors: list[str] = field(default_factory=list)
+    timestamp: str = ""  # ISO time the scrape started
+    metadata: dict[str, Any] = field(default_factory=dict)
+    retryable: bool = False
+    retry_after: Optional[float] = None
+
+
+def dumps_json(obj: Any) -> str:
+    """Pretty-print a payload as JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Whether an exception looks like a timeout or a flaky network"""
+    if isinstance(exc, asyncio.TimeoutError):
+        return True
+    # Playwright is imported only once a browser launches; before that no
+    # exception can be one of its timeouts
+    playwright_api = sys.modules.get("playwright.async_api")
+    if playwright_api is not None and isinstance(exc, playwright_api.TimeoutError):
+        return True
+    if httpx is not None and isinstance(
+        exc, (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+    ):
+        return True
+    message = str(exc)
+    return any(marker in message for marker in TRANSIENT_NETWORK_ERRORS)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convert a Retry-After header (seconds or HTTP date) to seconds"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+async def with_backoff(
+    fn: Callable[..., Awaitable[ScraperResult]],
+    *args,
+    max_retries: int = 5,
+    base: float = 1.0,
+    cap: float = 32.0,
+    jitter: float = 0.5,
+    **kwargs
+) -> ScraperResult:
+    """
+    Run a scrape, retrying transient failures with exponential backoff.
+    Jitter keeps concurrent batch retries from hitting a recovering host
+    in lockstep. A Retry-After header from the site takes precedence
+    when it asks for a longer wait, but no wait exceeds `cap`.
+    """
+    if max_retries < 1:
+        raise ValueError(f"max_retries must be at least 1, got {max_retries}")
+    
+    for attempt in range(max_retries):
+        last_attempt = attempt == max_retries - 1
+        retry_after = None
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception as e:
+            if last_attempt or not _is_transient(e):
+                raise
+            reason = str(e)
+        else:
+            if result.success or not result.retryable or last_attempt:
+                return result
+            reason = "; ".join(result.errors)
+            retry_after = result.retry_after
+        
+        delay = min(base * 2 ** attempt + random.uniform(0, jitter), cap)
+        if retry_after is not None:
+            delay = min(max(delay, retry_after), cap)
+        logger.info(f"Transient failure ({reason}), retry {attempt + 1} in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+
+class DomainRateLimiter:
+    """
+    Per-host politeness throttle.
+    Requests to the same host are spaced at least `min_interval` seconds
+    apart; requests to different hosts never wait on each other.
+    """
+    
+    def __init__(self, min_interval: float = 1.5):
+        self.min_interval = min_interval
+        self._locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._last_request: dict[str, float] = {}
+        
+    async def acquire(self, url: str):
+        """Wait until a request to this URL's host is allowed"""
+        host = urlparse(url).netloc
+        async with self._locks[host]:
+            loop = asyncio.get_running_loop()
+            last = self._last_request.get(host)
+            if last is not None:
+                wait = last + self.min_interval - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._last_request[host] = loop.time()
 
 
 class ConstructionScraper:
@@ -78,112 +415,523 @@ class ConstructionScraper:
     Demonstrates Provizual's core scraping workflow needs.
     """
     
-    def __init__(self):
-        self.browser: Optional[Browser] = None
+    def __init__(
+        self,
+        min_request_interval: float = 1.5,
+        pool_size: int = 5,
+        browser_pool_size: Optional[int] = None
+    ):
+        # Several Chromium processes so bursts don't serialize on one
+        # browser's main thread; SCRAPER_BROWSER_POOL sets the default
+        if browser_pool_size is None:
+            browser_pool_size = int(os.environ.get("SCRAPER_BROWSER_POOL", "2"))
+        self.browser_pool_size = max(1, browser_pool_size)
+        self.browsers: list["Browser"] = []
+        # One context per browser shared by all its pages: viewport, headers
+        # and connection pool are set up once instead of per scrape
+        self.contexts: list["BrowserContext"] = []
+        self._rr: Optional[Iterator["BrowserContext"]] = None
         self.playwright = None
+        # Pre-opened pages checked out per scrape; pool_size also caps how
+        # many browser scrapes run at once
+        self.pool_size = pool_size
+        self.page_pool: Optional[asyncio.Queue["Page"]] = None
+        # Screenshots waiting to be written by the background writer task
+        self._screenshot_queue: Optional[asyncio.Queue[tuple[str, bytes]]] = None
+        self._screenshot_task: Optional[asyncio.Task] = None
+        self.rate_limiter = DomainRateLimiter(min_request_interval)
+        self._init_lock = asyncio.Lock()
+        self._client: Optional["httpx.AsyncClient"] = None
+        # robots.txt fetches keyed by origin, shared by concurrent callers
+        self._robots: dict[str, asyncio.Task] = {}
+        # Successful results by (url, selectors, wait_for, requires_js),
+        # with the loop time they expire at; only used when cache_ttl > 0
+        self._result_cache: dict[tuple, tuple[float, ScraperResult]] = {}
         
     async def initialize(self):
         """Initialize Playwright browser"""
-        if not self.playwright:
-            self.playwright = await async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(
-                headless=True,
-                args=['--disable-blink-features=AutomationControlled']
+        # Concurrent scrapes must not race to launch a second browser pool
+        async with self._init_lock:
+            if not self.playwright:
+                # Playwright is heavy to import; it loads when the first browser launches
+                from playwright.async_api import async_playwright
+                playwright = await async_playwright().start()
+                args = list(BROWSER_ARGS)
+                # Only safe where the container itself is the sandbox
+                if os.environ.get("SCRAPER_NO_SANDBOX") == "1":
+                    args.append("--no-sandbox")
+                browsers = []
+                try:
+                    launched = await asyncio.gather(*(
+                        playwright.chromium.launch(headless=True, args=args)
+                        for _ in range(self.browser_pool_size)
+                    ), return_exceptions=True)
+                    browsers = [b for b in launched if not isinstance(b, BaseException)]
+                    for outcome in launched:
+                        if isinstance(outcome, BaseException):
+                            raise outcome
+                    contexts = list(await asyncio.gather(*(
+                        self._new_context(browser) for browser in browsers
+                    )))
+                    # Pooled pages are dealt out across the browsers in turn
+                    rr = itertools.cycle(contexts)
+                    pages = await asyncio.gather(
+                        *(next(rr).new_page() for _ in range(self.pool_size))
+                    )
+                except BaseException:
+                    # Leave nothing half-built: the next call starts over
+                    for browser in browsers:
+                        try:
+                            await browser.close()
+                        except Exception:
+                            pass
+                    await playwright.stop()
+                    raise
+                
+                self.playwright = playwright
+                self.browsers = browsers
+                self.contexts = contexts
+                self._rr = rr
+                self.page_pool = asyncio.Queue()
+                for page in pages:
+                    self.page_pool.put_nowait(page)
+                self._screenshot_queue = asyncio.Queue()
+                self._screenshot_task = asyncio.create_task(self._screenshot_writer())
+                logger.info(f"Browser initialized ({len(self.browsers)} processes)")
+    
+    async def _new_context(self, browser: "Browser") -> "BrowserContext":
+        """Context with the scraper's viewport, user agent and extractor"""
+        context = await browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            user_agent=USER_AGENT
+        )
+        await context.add_init_script(EXTRACT_INIT_JS)
+        return context
+    
+    async def _screenshot_writer(self):
+        """Write queued screenshots to disk off the event loop, one at a time"""
+        while True:
+            path, image = await self._screenshot_queue.get()
+            try:
+                await asyncio.to_thread(Path(path).write_bytes, image)
+                logger.info(f"Screenshot saved: {path}")
+            except OSError as e:
+                logger.error(f"Screenshot write failed for {path}: {e}")
+            finally:
+                self._screenshot_queue.task_done()
+    
+    @staticmethod
+    async def _filter_request(blocked: frozenset[str], route):
+        """Abort requests for the resource types a checked-out page blocks"""
+        if route.request.resource_type in blocked:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    @asynccontextmanager
+    async def pooled_page(self, block_resources: frozenset[str] = frozenset()) -> AsyncIterator["Page"]:
+        """
+        Check a page out of the pool, returning it blanked afterwards.
+        The request filter is installed only while a checkout blocks
+        something: routing sends every request through Python and turns
+        off the browser's HTTP cache, so unfiltered scrapes skip it.
+        """
+        await self.initialize()
+        page = await self.page_pool.get()
+        routed = None
+        try:
+            if page.is_closed():
+                page = await self._replace_page(page)
+            if block_resources:
+                routed = functools.partial(self._filter_request, block_resources)
+                await page.route("**/*", routed)
+            yield page
+        finally:
+            try:
+                if routed is not None:
+                    try:
+                        await page.unroute("**/*", routed)
+                    except Exception as e:
+                        # A page still filtering for this scrape can't be reused
+                        logger.debug(f"Pooled page unroute failed, replacing it: {e}")
+                        page = await self._replace_page(page)
+                page = await self._reset_page(page)
+            finally:
+                # The slot always goes back, even if the reset was cancelled,
+                # so the pool can never drain and block later scrapes
+                if self.page_pool is not None:
+                    self.page_pool.put_nowait(page)
+    
+    async def _reset_page(self, page: "Page") -> "Page":
+        """Blank a page for reuse, replacing it if it crashed or closed"""
+        try:
+            if not page.is_closed():
+                await page.goto("about:blank")
+                return page
+        except Exception as e:
+            logger.debug(f"Pooled page reset failed, replacing it: {e}")
+        return await self._replace_page(page)
+    
+    async def _replace_page(self, page: "Page") -> "Page":
+        """
+        Swap a dead page for a fresh one from the next browser that can
+        open one. If none can, the dead page keeps its slot: scrapes that
+        get it fail fast, and every checkout retries the replacement.
+        """
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception:
+            pass
+        for _ in range(len(self.contexts)):
+            try:
+                return await next(self._rr).new_page()
+            except Exception as e:
+                logger.error(f"Could not open a replacement page: {e}")
+        return page
+    
+    async def prewarm(self, url: str):
+        """
+        Resolve a host and fetch its robots.txt ahead of the first scrape,
+        so DNS and robots round-trips overlap with user input or setup.
+        """
+        parsed = urlparse(url)
+        if not parsed.hostname:
+            return
+        # Best effort: a bad URL is left for the scrape itself to report.
+        # Invalid ports and over-long IDNA labels raise ValueError subclasses.
+        try:
+            port = parsed.port or (443 if parsed.scheme == "https" else 80)
+            await asyncio.get_running_loop().getaddrinfo(parsed.hostname, port)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Prewarm DNS failed for {parsed.hostname}: {e}")
+            return
+        await self.robots(url)
+    
+    async def robots(self, url: str) -> Optional[RobotFileParser]:
+        """robots.txt rules for a URL's origin, fetched once and cached"""
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        if origin not in self._robots:
+            self._robots[origin] = asyncio.create_task(self._fetch_robots(origin))
+        return await self._robots[origin]
+    
+    async def _fetch_robots(self, origin: str) -> Optional[RobotFileParser]:
+        """Download and parse robots.txt; None when it cannot be retrieved"""
+        parser = RobotFileParser(f"{origin}/robots.txt")
+        try:
+            if httpx is None:
+                await asyncio.to_thread(parser.read)
+                return parser
+            response = await self._http_client().get(parser.url, timeout=5.0)
+        except Exception as e:
+            logger.debug(f"robots.txt unavailable for {origin}: {e}")
+            return None
+        # Same status handling as RobotFileParser.read()
+        if response.status_code in (401, 403):
+            parser.disallow_all = True
+        elif 400 <= response.status_code < 500:
+            parser.allow_all = True
+        elif response.status_code < 400:
+            parser.parse(response.text.splitlines())
+        else:
+            return None
+        return parser
+    
+    def _robots_allowed(self, url: str) -> Optional[bool]:
+        """Cached robots.txt verdict for a URL, or None if not fetched yet"""
+        parsed = urlparse(url)
+        task = self._robots.get(f"{parsed.scheme}://{parsed.netloc}")
+        if task is None or not task.done() or task.cancelled() or task.result() is None:
+            return None
+        return task.result().can_fetch(USER_AGENT, url)
+    
+    def _http_client(self) -> "httpx.AsyncClient":
+        """Pooled HTTP client for static pages, shared by every scrape"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=importlib.util.find_spec("h2") is not None,
+                headers={"User-Agent": USER_AGENT},
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                timeout=httpx.Timeout(10.0, connect=5.0),
             )
-            logger.info("Browser initialized")
+        return self._client
     
     async def cleanup(self):
         """Cleanup browser resources"""
-        if self.browser:
-            await self.browser.close()
+        if self._screenshot_task:
+            # Flush screenshots already handed back to callers
+            await self._screenshot_queue.join()
+            self._screenshot_task.cancel()
+            self._screenshot_task = None
+            self._screenshot_queue = None
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+        if self.page_pool:
+            while not self.page_pool.empty():
+                await self.page_pool.get_nowait().close()
+            self.page_pool = None
+        self._rr = None
+        for context in self.contexts:
+            await context.close()
+        self.contexts = []
+        for browser in self.browsers:
+            await browser.close()
+        self.browsers = []
         if self.playwright:
             await self.playwright.stop()
+            self.playwright = None
             
     async def scrape_pattern(self, config: ScraperConfig) -> ScraperResult:
         """
         Execute scraping pattern based on configuration.
         This mimics the 'copy and adapt existing patterns' workflow.
         """
+        cacheable = config.cache_ttl > 0 and not config.screenshot
+        if cacheable:
+            key = (
+                config.url, frozenset(config.selectors.items()),
+                config.wait_for, config.requires_js
+            )
+            now = asyncio.get_running_loop().time()
+            expires, cached = self._result_cache.get(key, (0.0, None))
+            if cached is not None and expires > now:
+                hit = copy.deepcopy(cached)
+                hit.metadata["cached"] = True
+                return hit
+        
+        # Static pages skip the browser entirely; screenshots still need it
+        if (not config.requires_js and not config.screenshot
+                and httpx is not None and lxml_html is not None):
+            result = await self._scrape_static(config)
+        else:
+            result = await self._scrape_browser(config)
+        
+        if cacheable and result.success:
+            self._result_cache.pop(key, None)
+            expires = asyncio.get_running_loop().time() + config.cache_ttl
+            self._result_cache[key] = (expires, copy.deepcopy(result))
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                # Plain dicts keep insertion order: drop the oldest entry
+                del self._result_cache[next(iter(self._result_cache))]
+        return result
+    
+    async def _scrape_browser(self, config: ScraperConfig) -> ScraperResult:
+        """Render the page in the pooled browser and extract in-page"""
         await self.initialize()
+        # One clock read per scrape, shared by the result and the screenshot name
+        started = time.time()
+        timestamp = datetime.fromtimestamp(started).isoformat()
         errors = []
         data = {}
         screenshot_path = None
+        retryable = False
+        retry_after = None
         
         try:
-            page = await self.browser.new_page()
+            # Wait out the host's spacing before taking a page, so a throttled
+            # host never holds pool slots other hosts could be using
+            await self.rate_limiter.acquire(config.url)
+            # Screenshots need the page rendered as a visitor would see it
+            blocked = frozenset() if config.screenshot else frozenset(config.block_resources)
+            async with self.pooled_page(blocked) as page:
+                logger.info(f"Navigating to {config.url}")
+                # With a wait_for selector as the readiness signal, return as
+                # soon as the response commits instead of waiting for the parse
+                response = await page.goto(
+                    config.url,
+                    wait_until="commit" if config.wait_for else "domcontentloaded",
+                    timeout=config.timeout
+                )
+                
+                if response and response.status >= 400:
+                    errors.append(f"HTTP {response.status}: {response.status_text}")
+                    if response.status in RETRYABLE_STATUS:
+                        retryable = True
+                        retry_after = _parse_retry_after(response.headers.get("retry-after"))
+                
+                # Wait for dynamic content if specified
+                if config.wait_for:
+                    try:
+                        await page.wait_for_selector(
+                            config.wait_for,
+                            timeout=config.timeout,
+                            state="visible"
+                        )
+                    except Exception as e:
+                        errors.append(f"Wait failed: {str(e)}")
+                        # Still extract from a fully parsed DOM, as before
+                        try:
+                            await page.wait_for_load_state(
+                                "domcontentloaded", timeout=config.timeout
+                            )
+                        except Exception:
+                            pass
+                
+                # Runs even without selectors: the same call returns the title
+                query, title = await _page_query(page, config.selectors)
+                data = _extract_fields(config.selectors, query, errors)
+                
+                # Capture screenshot if requested
+                if config.screenshot:
+                    extension = "jpg" if config.screenshot_format == "jpeg" else "png"
+                    screenshot_path = f"/tmp/screenshot_{started}.{extension}"
+                    options = {"quality": 80} if config.screenshot_format == "jpeg" else {}
+                    image = await page.screenshot(
+                        full_page=True, type=config.screenshot_format, **options
+                    )
+                    # The writer task saves it; the scrape moves on right away
+                    self._screenshot_queue.put_nowait((screenshot_path, image))
+                
+                # Collect metadata
+                metadata = {
+                    "url": config.url,
+                    "title": title,
+                    "response_status": response.status if response else None,
+                    "selectors_used": list(config.selectors.keys()),
+                    "robots_allowed": self._robots_allowed(config.url),
+                }
             
-            # Set viewport and user agent
-            await page.set_viewport_size({"width": 1920, "height": 1080})
-            await page.set_extra_http_headers({
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            })
+            return ScraperResult(
+                success=len(errors) == 0,
+                data=data,
+                screenshot_path=screenshot_path,
+                errors=errors,
+                timestamp=timestamp,
+                metadata=metadata,
+                retryable=retryable,
+                retry_after=retry_after
+            )
             
-            logger.info(f"Navigating to {config.url}")
-            response = await page.goto(
+        except Exception as e:
+            logger.error(f"Scraping failed: {str(e)}")
+            return ScraperResult(
+                success=False,
+                data={},
+                errors=[str(e)],
+                timestamp=timestamp,
+                retryable=_is_transient(e)
+            )
+
+    
+    async def scrape_batch(
+        self,
+        configs: list[ScraperConfig],
+        max_concurrency: int = 5
+    ) -> list[ScraperResult]:
+        """
+        Scrape many configs concurrently.
+        At most `max_concurrency` run at a time, spaced per host by the
+        rate limiter. Results keep the order of `configs`.
+        """
+        return list(await asyncio.gather(*self._bounded_scrapes(configs, max_concurrency)))
+    
+    def _bounded_scrapes(
+        self,
+        configs: list[ScraperConfig],
+        max_concurrency: int
+    ) -> list[Awaitable[ScraperResult]]:
+        """One scrape coroutine per config, sharing a single concurrency cap"""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def scrape_one(config: ScraperConfig) -> ScraperResult:
+            async with semaphore:
+                return await self.scrape_pattern(config)
+        
+        return [scrape_one(config) for config in configs]
+    
+    async def scrape_pattern_batch(
+        self,
+        urls: list[str],
+        base_config: ScraperConfig,
+        max_concurrency: int = 5
+    ) -> list[ScraperResult]:
+        """Scrape many URLs that share one pattern, in the order of `urls`"""
+        return await self.scrape_batch(
+            [base_config.model_copy(update={"url": url}) for url in urls],
+            max_concurrency
+        )
+    
+    async def iter_pattern_batch(
+        self,
+        urls: list[str],
+        base_config: ScraperConfig,
+        max_concurrency: int = 5
+    ) -> AsyncIterator[tuple[str, ScraperResult]]:
+        """
+        Like scrape_pattern_batch, but yield (url, result) pairs as each
+        scrape finishes so callers can persist results without waiting
+        for the slowest site. Wrap it in contextlib.aclosing when the loop
+        body can raise, so unfinished scrapes are cancelled straight away.
+        """
+        async def tagged(url: str, scrape: Awaitable[ScraperResult]) -> tuple[str, ScraperResult]:
+            return url, await scrape
+        
+        scrapes = self._bounded_scrapes(
+            [base_config.model_copy(update={"url": url}) for url in urls],
+            max_concurrency
+        )
+        tasks = [asyncio.create_task(tagged(url, scrape)) for url, scrape in zip(urls, scrapes)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The consumer stopped early: don't leave scrapes running, and
+            # let them unwind (returning pooled pages) before we return
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _scrape_static(self, config: ScraperConfig) -> ScraperResult:
+        """Fetch a page over pooled HTTP/2 and extract with lxml, no browser"""
+        timestamp = datetime.now().isoformat()
+        errors = []
+        retryable = False
+        retry_after = None
+        
+        try:
+            await self.rate_limiter.acquire(config.url)
+            logger.info(f"Fetching {config.url} (static)")
+            response = await self._http_client().get(
                 config.url,
-                wait_until="domcontentloaded",
-                timeout=config.timeout
+                timeout=httpx.Timeout(config.timeout / 1000, connect=5.0)
             )
             
-            if response and response.status >= 400:
-                errors.append(f"HTTP {response.status}: {response.status_text}")
+            if response.status_code >= 400:
+                errors.append(f"HTTP {response.status_code}: {response.reason_phrase}")
+                if response.status_code in RETRYABLE_STATUS:
+                    retryable = True
+                    retry_after = _parse_retry_after(response.headers.get("retry-after"))
             
-            # Wait for dynamic content if specified
-            if config.wait_for:
-                try:
-                    await page.wait_for_selector(
-                        config.wait_for,
-                        timeout=config.timeout,
-                        state="visible"
-                    )
-                except Exception as e:
-                    errors.append(f"Wait failed: {str(e)}")
+            parser = lxml_html.HTMLParser(encoding=response.encoding)
+            document = lxml_html.document_fromstring(response.content, parser=parser)
             
-            # Extract data using configured selectors
-            for key, selector in config.selectors.items():
-                try:
-                    elements = await page.query_selector_all(selector)
-                    if len(elements) == 1:
-                        # Single element - extract text or attribute
-                        text = await elements[0].text_content()
-                        data[key] = text.strip() if text else None
-                    elif len(elements) > 1:
-                        # Multiple elements - extract as list
-                        texts = []
-                        for elem in elements:
-                            text = await elem.text_content()
-                            if text:
-                                texts.append(text.strip())
-                        data[key] = texts
-                    else:
-                        data[key] = None
-                        errors.append(f"Selector '{selector}' found no elements")
-                except Exception as e:
-                    errors.append(f"Failed to extract '{key}': {str(e)}")
-                    data[key] = None
+            # No scripts run, so the wait selector must already be in the HTML
+            if config.wait_for:
+                matcher = _compile_selector(_normalize_selector(config.wait_for))
+                if matcher is not None and not matcher(document):
+                    errors.append(f"Wait failed: '{config.wait_for}' not in static HTML")
             
-            # Capture screenshot if requested
-            if config.screenshot:
-                screenshot_path = f"/tmp/screenshot_{datetime.now().timestamp()}.png"
-                await page.screenshot(path=screenshot_path, full_page=True)
-                logger.info(f"Screenshot saved: {screenshot_path}")
+            data = _extract_fields(config.selectors, _lxml_query(document), errors)
             
-            # Collect metadata
             metadata = {
                 "url": config.url,
-                "title": await page.title(),
-                "response_status": response.status if response else None,
+                "title": (document.findtext(".//title") or "").strip(),
+                "response_status": response.status_code,
                 "selectors_used": list(config.selectors.keys()),
+                "robots_allowed": self._robots_allowed(config.url),
             }
             
-            await page.close()
-            
             return ScraperResult(
                 success=len(errors) == 0,
                 data=data,
-                screenshot_path=screenshot_path,
                 errors=errors,
-                metadata=metadata
+                timestamp=timestamp,
+                metadata=metadata,
+                retryable=retryable,
+                retry_after=retry_after
             )
             
         except Exception as e:
@@ -191,7 +939,9 @@ class ConstructionScraper:
             return ScraperResult(
                 success=False,
                 data={},
-                errors=[str(e)]
+                errors=[str(e)],
+                timestamp=timestamp,
+                retryable=_is_transient(e)
             )
 
 
@@ -199,162 +949,245 @@ class ConstructionScraper:
 scraper = ConstructionScraper()
 
 
+# Resource and tool listings are static: build them, and the pattern JSON
+# served by read_resource, once at import instead of on every request
+_RESOURCES = [
+    Resource(
+        uri="pattern://construction-project",
+        name="Construction Project Pattern",
+        mimeType="application/json",
+        description="Pattern for scraping construction project listings"
+    ),
+    Resource(
+        uri="pattern://material-pricing",
+        name="Material Pricing Pattern",
+        mimeType="application/json",
+        description="Pattern for scraping building material prices"
+    ),
+    Resource(
+        uri="pattern://contractor-info",
+        name="Contractor Information Pattern",
+        mimeType="application/json",
+        description="Pattern for scraping contractor/supplier data"
+    ),
+]
+
+_PATTERNS = {
+    "pattern://construction-project": {
+        "description": "Extract construction project data",
+        "selectors": {
+            "project_name": ".project-title, h1.title",
+            "project_type": ".project-type, .category",
+            "location": ".location, .address",
+            "budget": ".budget, .cost",
+            "status": ".status, .project-status",
+            "contractor": ".contractor, .gc-name",
+            "completion_date": ".completion, .end-date"
+        },
+        "wait_for": ".project-details",
+        "example_urls": [
+            "https://www.construction.com/projects",
+            "https://www.dodge.construction/projects"
+        ]
+    },
+    "pattern://material-pricing": {
+        "description": "Extract building material pricing data",
+        "selectors": {
+            "material_name": ".product-name, h2.title",
+            "price": ".price, .cost",
+            "unit": ".unit, .uom",
+            "supplier": ".supplier, .vendor",
+            "availability": ".stock, .availability",
+            "last_updated": ".updated, .date"
+        },
+        "wait_for": ".pricing-table",
+    },
+    "pattern://contractor-info": {
+        "description": "Extract contractor/supplier information",
+        "selectors": {
+            "company_name": ".company-name, h1",
+            "contact_email": "a[href^='mailto:']",
+            "phone": ".phone, .contact-number",
+            "address": ".address, .location",
+            "specialties": ".specialty, .services",
+            "certifications": ".certification, .license"
+        },
+    }
+}
+
+_PATTERN_JSON = {uri: dumps_json(body) for uri, body in _PATTERNS.items()}
+_NOT_FOUND_JSON = dumps_json({"error": "Pattern not found"})
+
+
 @app.list_resources()
 async def list_resources() -> list[Resource]:
     """List available scraping patterns and templates"""
-    return [
-        Resource(
-            uri="pattern://construction-project",
-            name="Construction Project Pattern",
-            mimeType="application/json",
-            description="Pattern for scraping construction project listings"
-        ),
-        Resource(
-            uri="pattern://material-pricing",
-            name="Material Pricing Pattern",
-            mimeType="application/json",
-            description="Pattern for scraping building material prices"
-        ),
-        Resource(
-            uri="pattern://contractor-info",
-            name="Contractor Information Pattern",
-            mimeType="application/json",
-            description="Pattern for scraping contractor/supplier data"
-        ),
-    ]
+    return list(_RESOURCES)
 
 
 @app.read_resource()
 async def read_resource(uri: str) -> str:
     """Return scraping pattern templates"""
-    patterns = {
-        "pattern://construction-project": {
-            "description": "Extract construction project data",
-            "selectors": {
-                "project_name": ".project-title, h1.title",
-                "project_type": ".project-type, .category",
-                "location": ".location, .address",
-                "budget": ".budget, .cost",
-                "status": ".status, .project-status",
-                "contractor": ".contractor, .gc-name",
-                "completion_date": ".completion, .end-date"
-            },
-            "wait_for": ".project-details",
-            "example_urls": [
-                "https://www.construction.com/projects",
-                "https://www.dodge.construction/projects"
-            ]
-        },
-        "pattern://material-pricing": {
-            "description": "Extract building material pricing data",
-            "selectors": {
-                "material_name": ".product-name, h2.title",
-                "price": ".price, .cost",
-                "unit": ".unit, .uom",
-                "supplier": ".supplier, .vendor",
-                "availability": ".stock, .availability",
-                "last_updated": ".updated, .date"
-            },
-            "wait_for": ".pricing-table",
-        },
-        "pattern://contractor-info": {
-            "description": "Extract contractor/supplier information",
-            "selectors": {
-                "company_name": ".company-name, h1",
-                "contact_email": "a[href^='mailto:']",
-                "phone": ".phone, .contact-number",
-                "address": ".address, .location",
-                "specialties": ".specialty, .services",
-                "certifications": ".certification, .license"
-            },
-        }
-    }
-    
-    pattern = patterns.get(uri, {"error": "Pattern not found"})
-    return json.dumps(pattern, indent=2)
+    # MCP passes the URI as a pydantic AnyUrl, which never equals a str key
+    return _PATTERN_JSON.get(str(uri), _NOT_FOUND_JSON)
 
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available scraping tools"""
-    return [
-        Tool(
-            name="scrape_with_pattern",
-            description="""
-            Execute web scraping using a defined pattern.
-            This tool demonstrates the core Provizual workflow:
-            - Copy existing selector patterns
-            - Adapt to new data sources
-            - Validate scraped results
-            - Handle common failure modes
-            
-            Returns structured data ready for database insertion.
-            """,
-            inputSchema={
-                "type": "object",
-                "required": ["url", "selectors"],
-                "properties": {
-                    "url": {
-                        "type": "string",
-                        "description": "Target URL to scrape"
-                    },
-                    "selectors": {
-                        "type": "object",
-                        "description": "CSS selectors mapping field names to selectors",
-                        "additionalProperties": {"type": "string"}
-                    },
-                    "wait_for": {
-                        "type": "string",
-                        "description": "Optional selector to wait for before extraction"
-                    },
-                    "screenshot": {
-                        "type": "boolean",
-                        "description": "Capture screenshot for validation",
-                        "default": False
-                    }
+_TOOLS = [
+    Tool(
+        name="scrape_with_pattern",
+        description="""
+        Execute web scraping using a defined pattern.
+        This tool demonstrates the core Provizual workflow:
+        - Copy existing selector patterns
+        - Adapt to new data sources
+        - Validate scraped results
+        - Handle common failure modes
+        
+        Returns structured data ready for database insertion.
+        """,
+        inputSchema={
+            "type": "object",
+            "required": ["url", "selectors"],
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "Target URL to scrape"
+                },
+                "selectors": {
+                    "type": "object",
+                    "description": "CSS selectors mapping field names to selectors",
+                    "additionalProperties": {"type": "string"}
+                },
+                "wait_for": {
+                    "type": "string",
+                    "description": "Optional selector to wait for before extraction"
+                },
+                "screenshot": {
+                    "type": "boolean",
+                    "description": "Capture screenshot for validation",
+                    "default": False
+                },
+                "screenshot_format": {
+                    "type": "string",
+                    "enum": ["png", "jpeg"],
+                    "description": "Screenshot encoding",
+                    "default": "jpeg"
+                },
+                "requires_js": {
+                    "type": "boolean",
+                    "description": "Render in a browser; false fetches static HTML directly",
+                    "default": True
+                },
+                "block_resources": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Resource types the browser skips (e.g. image, font, media, stylesheet)",
+                    "default": sorted(DEFAULT_BLOCKED_RESOURCES)
+                },
+                "cache_ttl": {
+                    "type": "number",
+                    "description": "Seconds to reuse a successful result for an identical scrape",
+                    "default": 0
                 }
             }
-        ),
-        Tool(
-            name="validate_scraper",
-            description="""
-            Test a scraper pattern against a URL without full extraction.
-            Useful for debugging selector changes and site updates.
-            Returns what elements would be found by each selector.
-            """,
-            inputSchema={
-                "type": "object",
-                "required": ["url", "selectors"],
-                "properties": {
-                    "url": {"type": "string"},
-                    "selectors": {
-                        "type": "object",
-                        "additionalProperties": {"type": "string"}
-                    }
+        }
+    ),
+    Tool(
+        name="scrape_batch",
+        description="""
+        Scrape many URLs with one shared selector pattern in a single call.
+        URLs are fetched concurrently (bounded by max_concurrency) and
+        results are returned in the same order as the input URLs.
+        """,
+        inputSchema={
+            "type": "object",
+            "required": ["urls", "selectors"],
+            "properties": {
+                "urls": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Target URLs to scrape"
+                },
+                "selectors": {
+                    "type": "object",
+                    "description": "CSS selectors mapping field names to selectors",
+                    "additionalProperties": {"type": "string"}
+                },
+                "wait_for": {
+                    "type": "string",
+                    "description": "Optional selector to wait for before extraction"
+                },
+                "requires_js": {
+                    "type": "boolean",
+                    "description": "Render in a browser; false fetches static HTML directly",
+                    "default": True
+                },
+                "block_resources": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Resource types the browser skips (e.g. image, font, media, stylesheet)",
+                    "default": sorted(DEFAULT_BLOCKED_RESOURCES)
+                },
+                "cache_ttl": {
+                    "type": "number",
+                    "description": "Seconds to reuse a successful result for an identical scrape",
+                    "default": 0
+                },
+                "max_concurrency": {
+                    "type": "integer",
+                    "description": "Maximum number of pages scraped at once",
+                    "default": 5,
+                    "minimum": 1
                 }
             }
-        ),
-        Tool(
-            name="extract_with_ai",
-            description="""
-            Use LLM to intelligently extract data when selectors fail.
-            Fallback strategy for dynamic sites or structural changes.
-            Analyzes page content and extracts requested fields semantically.
-            """,
-            inputSchema={
-                "type": "object",
-                "required": ["url", "fields"],
-                "properties": {
-                    "url": {"type": "string"},
-                    "fields": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of fields to extract (e.g., ['price', 'title'])"
-                    }
+        }
+    ),
+    Tool(
+        name="validate_scraper",
+        description="""
+        Test a scraper pattern against a URL without full extraction.
+        Useful for debugging selector changes and site updates.
+        Returns what elements would be found by each selector.
+        """,
+        inputSchema={
+            "type": "object",
+            "required": ["url", "selectors"],
+            "properties": {
+                "url": {"type": "string"},
+                "selectors": {
+                    "type": "object",
+                    "additionalProperties": {"type": "string"}
                 }
             }
-        )
-    ]
+        }
+    ),
+    Tool(
+        name="extract_with_ai",
+        description="""
+        Use LLM to intelligently extract data when selectors fail.
+        Fallback strategy for dynamic sites or structural changes.
+        Analyzes page content and extracts requested fields semantically.
+        """,
+        inputSchema={
+            "type": "object",
+            "required": ["url", "fields"],
+            "properties": {
+                "url": {"type": "string"},
+                "fields": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of fields to extract (e.g., ['price', 'title'])"
+                }
+            }
+        }
+    )
+]
+
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available scraping tools"""
+    return list(_TOOLS)
 
 
 @app.call_tool()
@@ -365,48 +1198,81 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent | ImageConten
         config = ScraperConfig(**arguments)
         result = await scraper.scrape_pattern(config)
         
-        response_parts = [
-            TextContent(
-                type="text",
-                text=f"""
-# Scraping Result
-
-**Status:** {'✓ Success' if result.success else '✗ Failed'}
-**URL:** {config.url}
-**Timestamp:** {result.timestamp}
+        parts = [
+            "",
+            "# Scraping Result",
+            "",
+            f"**Status:** {'✓ Success' if result.success else '✗ Failed'}",
+            f"**URL:** {config.url}",
+            f"**Timestamp:** {result.timestamp}",
+            "",
+            "## Extracted Data",
+            "```json",
+            dumps_json(result.data),
+            "```",
+            "",
+            "## Metadata",
+            "```json",
+            dumps_json(result.metadata),
+            "```",
+        ]
+        if result.errors:
+            parts.append("\n## Errors")
+            parts.extend(f"- {e}" for e in result.errors)
+        
+        return [TextContent(type="text", text="\n".join(parts))]
+        
+    elif name == "scrape_batch":
+        arguments = dict(arguments)
+        urls = arguments.pop("urls")
+        max_concurrency = max(1, int(arguments.pop("max_concurrency", 5)))
+        # A stray "url" in the shared arguments must not clash with each URL
+        configs = [ScraperConfig(**{**arguments, "url": url}) for url in urls]
+        results = await scraper.scrape_batch(configs, max_concurrency)
+        
+        succeeded = sum(result.success for result in results)
+        summary = [
+            {
+                "url": config.url,
+                "success": result.success,
+                "data": result.data,
+                "errors": result.errors
+            }
+            for config, result in zip(configs, results)
+        ]
+        
+        return [TextContent(
+            type="text",
+            text=f"""
+# Batch Scraping Result
 
-## Extracted Data
-```json
-{json.dumps(result.data, indent=2)}
-```
+**Succeeded:** {succeeded}/{len(results)}
 
-## Metadata
+## Results
 ```json
-{json.dumps(result.metadata, indent=2)}
+{dumps_json(summary)}
 ```
-""" + (f"\n## Errors\n" + "\n".join(f"- {e}" for e in result.errors) if result.errors else "")
-            )
-        ]
-        
-        return response_parts
+"""
+        )]
         
     elif name == "validate_scraper":
-        await scraper.initialize()
-        page = await scraper.browser.new_page()
-        
         try:
-            await page.goto(arguments["url"], wait_until="domcontentloaded")
-            validation_results = {}
-            
-            for key, selector in arguments["selectors"].items():
-                elements = await page.query_selector_all(selector)
-                validation_results[key] = {
-                    "selector": selector,
-                    "found_count": len(elements),
-                    "status": "✓ Found" if elements else "✗ Not Found"
-                }
-            
-            await page.close()
+            await scraper.rate_limiter.acquire(arguments["url"])
+            async with scraper.pooled_page(DEFAULT_BLOCKED_RESOURCES) as page:
+                await page.goto(arguments["url"], wait_until="domcontentloaded")
+                validation_results = {}
+                
+                # Count matches in-page in one round-trip rather than
+                # materializing an element handle per match
+                selectors = arguments["selectors"]
+                query, _ = await _page_query(page, selectors) if selectors else (None, None)
+                for key, selector in selectors.items():
+                    found = len(query(_normalize_selector(selector)))
+                    validation_results[key] = {
+                        "selector": selector,
+                        "found_count": found,
+                        "status": "✓ Found" if found else "✗ Not Found"
+                    }
             
             return [TextContent(
                 type="text",
@@ -417,7 +1283,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent | ImageConten
 
 ## Results
 ```json
-{json.dumps(validation_results, indent=2)}
+{dumps_json(validation_results)}
 ```
 """
             )]